@@ -2,6 +2,7 @@ import json
 import os
 import threading
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import partial
 from datetime import datetime
@@ -21,6 +22,7 @@ from skyplane.planner.topology import TopologyPlan, TopologyPlanGateway
 from skyplane.utils import logger
 from skyplane.utils.definitions import gateway_docker_image, tmp_log_dir
 from skyplane.utils.fn import PathLike, do_parallel
+from skyplane.utils.retry import FullJitterRetry
 
 if TYPE_CHECKING:
     from skyplane.api.provisioner import Provisioner
@@ -41,6 +43,9 @@ class DataplaneAutoDeprovision:
 class Dataplane:
     """A Dataplane represents a concrete Skyplane network, including topology and VMs."""
 
+    # cap on concurrent per-gateway SSH sessions (log copies, container startup) to avoid sshd and cloud API throttling
+    max_ssh_jobs = 64
+
     def __init__(
         self,
         clientid: str,
@@ -66,14 +71,18 @@ class Dataplane:
         self.transfer_config = transfer_config
         # disable for azure
         # TODO: remove this
-        self.http_pool = urllib3.PoolManager(retries=urllib3.Retry(total=3))
+        # each per-destination monitor polls error logs concurrently, so keep one connection per monitor alive for each gateway
+        self.http_pool = urllib3.PoolManager(
+            retries=FullJitterRetry(total=3, backoff_factor=1.0),
+            num_pools=max(10, len(topology.get_gateways())),
+            maxsize=max(1, len(topology.dest_region_tags)),
+        )
         self.provisioning_lock = threading.Lock()
         self.provisioned = False
+        self.error_logs_copied = False  # set once logs are copied after a gateway failure, so cleanup doesn't copy them again
         self.log_dir = Path(log_dir)
-        self.transfer_dir = tmp_log_dir / "transfer_logs" / datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.transfer_dir.mkdir(exist_ok=True, parents=True)
 
-        # transfer logs
+        # transfer logs (created once here, so parallel log writers never need to mkdir)
         self.transfer_dir = tmp_log_dir / "transfer_logs" / datetime.now().strftime("%Y%m%d_%H%M%S")
         self.transfer_dir.mkdir(exist_ok=True, parents=True)
         self.debug = debug
@@ -130,7 +139,7 @@ class Dataplane:
         allow_firewall: bool = True,
         gateway_docker_image: str = os.environ.get("SKYPLANE_DOCKER_IMAGE", gateway_docker_image()),
         authorize_ssh_pub_key: Optional[str] = None,
-        max_jobs: int = 16,
+        max_jobs: int = 64,
         spinner: bool = False,
     ):
         """
@@ -142,7 +151,7 @@ class Dataplane:
         :type gateway_docker_image: str
         :param authorize_ssh_pub_key: authorization ssh key to the remote gateways
         :type authorize_ssh_pub_key: str
-        :param max_jobs: maximum number of provision jobs to launch concurrently (default: 16)
+        :param max_jobs: maximum number of provision jobs to launch concurrently (default: 64)
         :type max_jobs: int
         :param spinner: whether to show the spinner during the job (default: False)its to determine how many instances to create in each region
         :type spinner: bool
@@ -186,6 +195,9 @@ class Dataplane:
             servers_by_region = defaultdict(list)
             for s in servers:
                 servers_by_region[s.region_tag].append(s)
+
+            # prefetch ip addresses in parallel (cloud API calls, so bounded by max_jobs), servers cache them for later lookups
+            do_parallel(lambda s: (s.private_ip(), s.public_ip()), servers, n=max_jobs)
             for node in self.topology.get_gateways():
                 instance = servers_by_region[node.region_tag].pop()
                 self.bound_nodes[node] = instance
@@ -222,22 +234,39 @@ class Dataplane:
             )
         logger.fs.debug(f"[Dataplane.provision] Starting gateways on {len(jobs)} servers")
         try:
-            do_parallel(lambda fn: fn(), jobs, n=-1, spinner=spinner, spinner_persist=spinner, desc="Starting gateway container on VMs")
+            do_parallel(
+                lambda fn: fn(),
+                jobs,
+                n=min(self.max_ssh_jobs, len(jobs)),
+                spinner=spinner,
+                spinner_persist=spinner,
+                desc="Starting gateway container on VMs",
+            )
         except Exception:
-            self.copy_gateway_logs()
+            self.copy_gateway_logs(on_error=True)
             raise GatewayContainerStartException(f"Error starting gateways. Please check gateway logs {self.transfer_dir}")
 
-    def copy_gateway_logs(self):
+    def copy_gateway_logs(self, on_error: bool = False):
+        """Copy the logs of all gateways into transfer_dir.
+
+        :param on_error: whether this copy is for a gateway failure; only the first such copy runs (default: False)
+        :type on_error: bool
+        """
+        if on_error and self.error_logs_copied:
+            return
+
         # copy logs from all gateways in parallel
         def copy_log(instance):
-            out_file = self.transfer_dir / f"gateway_{instance.uuid()}.stdout"
-            err_file = self.transfer_dir / f"gateway_{instance.uuid()}.stderr"
-            logger.fs.info(f"[Dataplane.copy_gateway_logs] Copying logs from {instance.uuid()}: {out_file}")
-            instance.run_command("sudo docker logs -t skyplane_gateway 2> /tmp/gateway.stderr > /tmp/gateway.stdout")
-            instance.download_file("/tmp/gateway.stdout", out_file)
-            instance.download_file("/tmp/gateway.stderr", err_file)
+            uid = instance.uuid()
+            log_file = self.transfer_dir / f"gateway_{uid}.log.gz"
+            logger.fs.info(f"[Dataplane.copy_gateway_logs] Copying logs from {uid}: {log_file}")
+            # compress on the gateway, logs from long transfers are large and highly compressible (read with zcat)
+            # pipefail so a failing docker logs (e.g. missing container) is reported rather than masked by gzip's exit status
+            instance.run_command_to_file("set -o pipefail; sudo docker logs -t skyplane_gateway 2>&1 | gzip -1", log_file)
 
-        do_parallel(copy_log, self.bound_nodes.values(), n=-1)
+        do_parallel(copy_log, self.bound_nodes.values(), n=min(self.max_ssh_jobs, len(self.bound_nodes)))
+        if on_error:
+            self.error_logs_copied = True
 
     def deprovision(self, max_jobs: int = 64, spinner: bool = False):
         """
@@ -249,7 +278,7 @@ class Dataplane:
         :type spinner: bool
         """
         with self.provisioning_lock:
-            if self.debug and self.provisioned:
+            if self.debug and self.provisioned and not self.error_logs_copied:
                 logger.fs.info(f"Copying gateway logs to {self.transfer_dir}")
                 self.copy_gateway_logs()
 
@@ -270,8 +299,12 @@ class Dataplane:
                 )
                 self.provisioned = False
 
-    def check_error_logs(self) -> Dict[str, List[str]]:
-        """Get the error log from remote gateways if there is any error."""
+    def check_error_logs(self, executor: Optional[ThreadPoolExecutor] = None) -> Dict[str, List[str]]:
+        """Get the error log from remote gateways if there is any error.
+
+        :param executor: thread pool to issue the requests on, e.g. one held open by a polling loop (default: None, use a new pool)
+        :type executor: ThreadPoolExecutor
+        """
 
         def get_error_logs(args):
             _, instance = args
@@ -281,7 +314,7 @@ class Dataplane:
             return json.loads(reply.data.decode("utf-8"))["errors"]
 
         errors: Dict[str, List[str]] = {}
-        for (_, instance), result in do_parallel(get_error_logs, self.bound_nodes.items(), n=8):
+        for (_, instance), result in do_parallel(get_error_logs, self.bound_nodes.items(), n=8, executor=executor):
             errors[instance] = result
         return errors
 
@@ -106,12 +106,10 @@ class Pipeline:
 
             # wait for job to finish
             tracker.join()
-
-            # copy gateway logs
-            if debug:
-                dp.copy_gateway_logs()
         except Exception:
-            dp.copy_gateway_logs()
+            # debug dataplanes copy gateway logs on deprovision
+            if not debug:
+                dp.copy_gateway_logs(on_error=True)
         dp.deprovision(spinner=True)
         return dp
 
@@ -124,7 +122,7 @@ class Pipeline:
                 dp.copy_gateway_logs()
             return tracker
         except Exception:
-            dp.copy_gateway_logs()
+            dp.copy_gateway_logs(on_error=True)
             return
 
     def queue_copy(
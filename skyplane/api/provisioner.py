@@ -1,4 +1,5 @@
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from functools import partial
 
@@ -185,12 +186,14 @@ class Provisioner:
         self.temp_nodes.remove(server)
         return server
 
-    def provision(self, authorize_firewall: bool = True, max_jobs: int = 16, spinner: bool = False) -> List[str]:
+    def provision(self, authorize_firewall: bool = True, max_jobs: int = 64, spinner: bool = False) -> List[str]:
         """Provision the VMs in the pending_provisioner_tasks list. Returns UUIDs of provisioned VMs.
 
         :param authorize_firewall: whether to add authorization firewall to the remote gateways (default: True)
         :type authorize_firewall: bool
-        :param max_jobs: maximum number of provision jobs to launch concurrently (default: 16)
+        :param max_jobs: maximum number of provision jobs to launch concurrently (default: 64); the instance creation API calls
+            are still capped per cloud provider by its provisioning_semaphore (AWS and IBM Cloud: 16, Azure: 5), so a larger
+            value mainly overlaps the wait for SSH on the new instances
         :type max_jobs: int
         :param spinner: whether to show the spinner during the job (default: False)
         :type spinner: bool
@@ -265,8 +268,8 @@ class Provisioner:
             logger.fs.info(f"[Provisioner.provision] Authorized AWS gateways with firewalls: {public_ips}")
             logger.fs.info(f"[Provisioner.provision] Authorized GCP gateways with firewalls: {public_ips}, {private_ips}")
 
-        for task in provision_tasks:
-            self.pending_provisioner_tasks.remove(task)
+        provisioned_tasks = set(provision_tasks)
+        self.pending_provisioner_tasks = [task for task in self.pending_provisioner_tasks if task not in provisioned_tasks]
 
         return [task.uuid for task in provision_tasks]
 
@@ -283,13 +286,11 @@ class Provisioner:
         if not self.provisioned_vms and not self.temp_nodes:
             return []
 
+        task_uuids = {s: task_uuid for task_uuid, s in self.provisioned_vms.items()}
+
         def deprovision_gateway_instance(server: compute.Server):
             server.terminate_instance()
-            idx_to_del = None
-            for idx, s in list(self.provisioned_vms.items()):
-                if s == server:
-                    idx_to_del = idx
-                    break
+            idx_to_del = task_uuids.get(server)
             if idx_to_del:
                 del self.provisioned_vms[idx_to_del]
             else:
@@ -306,27 +307,34 @@ class Provisioner:
         if azure_deprovisioned:
             logger.warning("Azure deprovisioning is very slow. Please be patient.")
         logger.fs.info(f"[Provisioner.deprovision] Deprovisioning {len(servers)} VMs")
-        do_parallel(
-            deprovision_gateway_instance,
-            servers,
-            n=max_jobs,
-            spinner=spinner,
-            spinner_persist=False,
-            desc="Deprovisioning VMs",
-        )
-
-        # clean up firewall
-        if deauthorize_firewall:
-            # todo remove firewall rules for Azure
-            public_ips = [s.public_ip() for s in servers]
-            jobs = []
-            if aws_deprovisioned:
-                aws_regions = set([s.region() for s in servers if s.provider == "aws"])
-                jobs.extend([partial(self.aws.remove_ips_from_security_group, r, public_ips) for r in set(aws_regions)])
-                logger.fs.info(f"[Provisioner.deprovision] Deauthorizing AWS gateways with firewalls: {public_ips}")
-            if gcp_deprovisioned:
-                jobs.extend([partial(self.gcp.remove_gateway_rule, rule) for rule in self.gcp_firewall_rules])
-                logger.fs.info(f"[Provisioner.deprovision] Deauthorizing GCP gateways with firewalls: {self.gcp_firewall_rules}")
+        # terminate VMs and clean up firewalls on one pool rather than a new pool per phase
+        with ThreadPoolExecutor(max_workers=len(servers) if max_jobs == -1 else max_jobs) as pool:
             do_parallel(
-                lambda fn: fn(), jobs, n=max_jobs, spinner=spinner, spinner_persist=False, desc="Deauthorizing gateways from firewalls"
+                deprovision_gateway_instance,
+                servers,
+                spinner=spinner,
+                spinner_persist=False,
+                desc="Deprovisioning VMs",
+                executor=pool,
             )
+
+            # clean up firewall
+            if deauthorize_firewall:
+                # todo remove firewall rules for Azure
+                public_ips = [s.public_ip() for s in servers]
+                jobs = []
+                if aws_deprovisioned:
+                    aws_regions = set([s.region() for s in servers if s.provider == "aws"])
+                    jobs.extend([partial(self.aws.remove_ips_from_security_group, r, public_ips) for r in set(aws_regions)])
+                    logger.fs.info(f"[Provisioner.deprovision] Deauthorizing AWS gateways with firewalls: {public_ips}")
+                if gcp_deprovisioned:
+                    jobs.extend([partial(self.gcp.remove_gateway_rule, rule) for rule in self.gcp_firewall_rules])
+                    logger.fs.info(f"[Provisioner.deprovision] Deauthorizing GCP gateways with firewalls: {self.gcp_firewall_rules}")
+                do_parallel(
+                    lambda fn: fn(),
+                    jobs,
+                    spinner=spinner,
+                    spinner_persist=False,
+                    desc="Deauthorizing gateways from firewalls",
+                    executor=pool,
+                )
@@ -1,7 +1,6 @@
 import json
 import time
 from abc import ABC
-from datetime import datetime
 from threading import Thread
 
 import urllib3
@@ -14,6 +13,7 @@ from skyplane.api.config import TransferConfig
 from skyplane.chunk import ChunkState, Chunk
 from skyplane.utils import logger, imports
 from skyplane.utils.fn import do_parallel
+from skyplane.utils.retry import FullJitterRetry
 from skyplane.api.usage import UsageClient
 from skyplane.utils.definitions import GB
 
@@ -111,10 +111,17 @@ class TransferProgressTracker(Thread):
         self.job_chunk_requests: Dict[str, Dict[str, Chunk]] = {}
         self.job_pending_chunk_ids: Dict[str, Dict[str, Set[str]]] = {}
         self.job_complete_chunk_ids: Dict[str, Dict[str, Set[str]]] = {}
+        self.chunk_to_job_map: Dict[str, str] = {}
         self.errors: Optional[Dict[str, List[str]]] = None
 
-        # http_pool
-        self.http_pool = urllib3.PoolManager(retries=urllib3.Retry(total=9))
+        # http_pool, with a connection per gateway for each concurrent per-destination monitor so connections are kept alive
+        # (one pool per gateway host, so pools are not evicted on topologies with more than urllib3's default of 10 gateways)
+        n_monitors = max(1, len(dataplane.topology.dest_region_tags))
+        self.http_pool = urllib3.PoolManager(
+            retries=FullJitterRetry(total=9, backoff_factor=1.0),
+            num_pools=max(10, len(dataplane.topology.get_gateways())),
+            maxsize=n_monitors,
+        )
 
     def __str__(self):
         return f"TransferProgressTracker({self.dataplane}, {self.jobs})"
@@ -152,6 +159,7 @@ class TransferProgressTracker(Thread):
                     chunks_dispatched = [chunk]
                     # TODO: check chunk ID
                     self.job_chunk_requests[job_uuid][chunk.chunk_id] = chunk
+                    self.chunk_to_job_map[chunk.chunk_id] = job_uuid
                     assert job_uuid in self.job_chunk_requests and chunk.chunk_id in self.job_chunk_requests[job_uuid]
                     self.hooks.on_chunk_dispatched(chunks_dispatched)
                     for region in self.dataplane.topology.dest_region_tags:
@@ -262,101 +270,155 @@ class TransferProgressTracker(Thread):
             )
             print_stats_completed(total_runtime_s=transfer_stats["total_runtime_s"], throughput_gbits=transfer_stats["throughput_gbits"])
 
-    @imports.inject("pandas")
-    def monitor_transfer(pd, self, region_tag):
+    def monitor_transfer(self, region_tag):
         """Monitor the tranfer by copying remote gateway logs and show transfer stats by hooks"""
         # todo implement transfer monitoring to update job_complete_chunk_ids and job_pending_chunk_ids while the transfer is in progress
 
         # regions that are sinks for specific region tag
         # TODO: should eventualy map bucket to list of instances
         sinks = [n for nodes in self.dataplane.topology.sink_instances(region_tag).values() for n in nodes]
-
-        while any([len(self.job_pending_chunk_ids[job_uuid][region_tag]) > 0 for job_uuid in self.job_pending_chunk_ids]):
-            # refresh shutdown status by running noop
-            do_parallel(lambda i: i.run_command("echo 1"), self.dataplane.bound_nodes.values(), n=8)
-
-            # check for errors and exit if there are any (while setting debug flags)
-            errors = self.dataplane.check_error_logs()
-            if any(errors.values()):
-                logger.warning("Copying gateway logs...")
-                self.dataplane.copy_gateway_logs()
-                self.errors = errors
-                raise exceptions.SkyplaneGatewayException("Transfer failed with errors", errors)
-
-            log_df = pd.DataFrame(self._query_chunk_status())
-            if log_df.empty:
-                logger.warning("No chunk status log entries yet")
-                time.sleep(0.05)
-                continue
-
-            # TODO: have visualization for completition across all destinations
-            is_complete_rec = (
-                lambda row: row["state"] == ChunkState.complete
-                and row["instance"] in [s.gateway_id for s in sinks]
-                # and row["region_tag"] in region_sinks
-            )
-            sink_status_df = log_df[log_df.apply(is_complete_rec, axis=1)]
-            completed_chunk_ids = list(set(sink_status_df.chunk_id.unique()))
-
-            # update job_complete_chunk_ids and job_pending_chunk_ids
-            # TODO: do chunk-tracking per-destination
-            for job_uuid, job in self.jobs.items():
-                try:
-                    job_complete_chunk_ids = set(
-                        chunk_id for chunk_id in completed_chunk_ids if self._chunk_to_job_map[chunk_id] == job_uuid
+        sink_gateway_ids = {s.gateway_id for s in sinks}
+
+        # per-gateway offsets into the chunk status log, so each poll only fetches new entries
+        log_offsets: Dict[str, int] = {}
+
+        # the noop refresh (an SSH exec per gateway) only needs to run well within the shortest auto-shutdown timeout
+        shutdown_timeouts = [
+            s.auto_shutdown_timeout_minutes for s in self.dataplane.bound_nodes.values() if s.auto_shutdown_timeout_minutes
+        ]
+        keepalive_interval_s = min([60.0] + [minutes * 60 / 2 for minutes in shutdown_timeouts])
+        last_keepalive = 0.0
+
+        # max time a sink gateway holds a status poll open waiting for new log entries; only sinks report completions, so the
+        # other gateways are polled without waiting and an idle source can't hold up a tick after a sink has answered
+        status_poll_wait_ms = 500
+
+        # minimum time between ticks, so the loop stays paced while busy gateways answer long-polls immediately
+        min_tick_interval_s = 0.1
+        last_tick = 0.0
+
+        # one pool for the HTTP status/error polling so each tick reuses threads and pooled connections; one worker per gateway
+        # so idle gateways' long-polls all wait concurrently rather than in waves
+        with ThreadPoolExecutor(max_workers=max(1, len(self.dataplane.bound_nodes))) as poll_executor:
+            while any([len(self.job_pending_chunk_ids[job_uuid][region_tag]) > 0 for job_uuid in self.job_pending_chunk_ids]):
+                time.sleep(max(0.0, min_tick_interval_s - (time.time() - last_tick)))
+                last_tick = time.time()
+
+                # refresh shutdown status by running noop (on its own bounded pool, to cap concurrent SSH sessions)
+                if time.time() - last_keepalive > keepalive_interval_s:
+                    do_parallel(
+                        lambda i: i.run_command("echo 1"),
+                        self.dataplane.bound_nodes.values(),
+                        n=min(self.dataplane.max_ssh_jobs, len(self.dataplane.bound_nodes)),
                     )
-                except Exception as e:
-                    raise e
-                new_chunk_ids = (
-                    self.job_complete_chunk_ids[job_uuid][region_tag]
-                    .union(job_complete_chunk_ids)
-                    .difference(self.job_complete_chunk_ids[job_uuid][region_tag])
-                )
-                completed_chunks = []
-                for id in new_chunk_ids:
-                    assert (
-                        job_uuid in self.job_chunk_requests and id in self.job_chunk_requests[job_uuid]
-                    ), f"Missing chunk id {id} for job {job_uuid}: {self.job_chunk_requests}"
-                for id in new_chunk_ids:
-                    completed_chunks.append(self.job_chunk_requests[job_uuid][id])
-                self.hooks.on_chunk_completed(completed_chunks, region_tag)
-                self.job_complete_chunk_ids[job_uuid][region_tag] = self.job_complete_chunk_ids[job_uuid][region_tag].union(
-                    job_complete_chunk_ids
-                )
-                self.job_pending_chunk_ids[job_uuid][region_tag] = self.job_pending_chunk_ids[job_uuid][region_tag].difference(
-                    job_complete_chunk_ids
+                    last_keepalive = time.time()
+
+                # check for errors and exit if there are any (while setting debug flags)
+                errors = self.dataplane.check_error_logs(executor=poll_executor)
+                if any(errors.values()):
+                    logger.warning("Copying gateway logs...")
+                    self.dataplane.copy_gateway_logs(on_error=True)
+                    self.errors = errors
+                    raise exceptions.SkyplaneGatewayException("Transfer failed with errors", errors)
+
+                # long-poll the gateways, so the request itself paces the loop while no chunk changes state
+                log_df = self._query_chunk_status(
+                    log_offsets, executor=poll_executor, wait_ms=status_poll_wait_ms, wait_gateway_ids=sink_gateway_ids
                 )
-            # sleep
-            time.sleep(0.05)
+                if log_df.empty:
+                    if not any(log_offsets.values()):
+                        logger.warning("No chunk status log entries yet")
+                    continue
+
+                # TODO: have visualization for completition across all destinations
+                is_complete_rec = (log_df["state"] == ChunkState.complete) & log_df["instance"].isin(sink_gateway_ids)
+                sink_status_df = log_df[is_complete_rec]
+                completed_chunk_ids = list(sink_status_df.chunk_id.unique())
+
+                # update job_complete_chunk_ids and job_pending_chunk_ids
+                # TODO: do chunk-tracking per-destination
+                for job_uuid, job in self.jobs.items():
+                    try:
+                        job_complete_chunk_ids = set(
+                            chunk_id for chunk_id in completed_chunk_ids if self.chunk_to_job_map[chunk_id] == job_uuid
+                        )
+                    except Exception as e:
+                        raise e
+                    new_chunk_ids = (
+                        self.job_complete_chunk_ids[job_uuid][region_tag]
+                        .union(job_complete_chunk_ids)
+                        .difference(self.job_complete_chunk_ids[job_uuid][region_tag])
+                    )
+                    completed_chunks = []
+                    for id in new_chunk_ids:
+                        assert (
+                            job_uuid in self.job_chunk_requests and id in self.job_chunk_requests[job_uuid]
+                        ), f"Missing chunk id {id} for job {job_uuid}: {self.job_chunk_requests}"
+                    for id in new_chunk_ids:
+                        completed_chunks.append(self.job_chunk_requests[job_uuid][id])
+                    self.hooks.on_chunk_completed(completed_chunks, region_tag)
+                    self.job_complete_chunk_ids[job_uuid][region_tag] = self.job_complete_chunk_ids[job_uuid][region_tag].union(
+                        job_complete_chunk_ids
+                    )
+                    self.job_pending_chunk_ids[job_uuid][region_tag] = self.job_pending_chunk_ids[job_uuid][region_tag].difference(
+                        job_complete_chunk_ids
+                    )
 
-    @property
-    # TODO: this is a very slow function, but we can't cache it since self.job_chunk_requests changes over time
-    # do not call it more often than necessary
-    def _chunk_to_job_map(self):
-        return {chunk_id: job_uuid for job_uuid, cr_dict in self.job_chunk_requests.items() for chunk_id in cr_dict.keys()}
+    @imports.inject("pandas")
+    def _query_chunk_status(
+        pd,
+        self,
+        log_offsets: Optional[Dict[str, int]] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+        wait_ms: int = 0,
+        wait_gateway_ids: Optional[Set[str]] = None,
+    ):
+        """Fetch chunk status log entries from all gateways as a DataFrame, with time and state decoded column-wise.
+
+        :param log_offsets: per-gateway offsets into the status log; if set, only entries past the offset are fetched and the
+            offsets are advanced in place (default: None, fetch the full log)
+        :type log_offsets: Dict[str, int]
+        :param executor: thread pool to issue the requests on (default: None, use a new pool)
+        :type executor: ThreadPoolExecutor
+        :param wait_ms: how long each gateway may hold the request open waiting for new entries (default: 0, return immediately)
+        :type wait_ms: int
+        :param wait_gateway_ids: gateways that wait_ms applies to, the rest return immediately (default: None, all gateways)
+        :type wait_gateway_ids: Set[str]
+        """
 
-    def _query_chunk_status(self):
         def get_chunk_status(args):
             node, instance = args
-            reply = self.http_pool.request("GET", f"{instance.gateway_api_url}/api/v1/chunk_status_log")
+            since = log_offsets.get(node.gateway_id, 0) if log_offsets is not None else 0
+            node_wait_ms = wait_ms if wait_gateway_ids is None or node.gateway_id in wait_gateway_ids else 0
+            reply = self.http_pool.request(
+                "GET", f"{instance.gateway_api_url}/api/v1/chunk_status_log", fields={"since": since, "wait_ms": node_wait_ms}
+            )
             if reply.status != 200:
                 raise Exception(
                     f"Failed to get chunk status from gateway instance {instance.instance_name()}: {reply.data.decode('utf-8')}"
                 )
-            logs = []
-            for log_entry in json.loads(reply.data.decode("utf-8"))["chunk_status_log"]:
-                log_entry["region_tag"] = node.region_tag
-                log_entry["instance"] = node.gateway_id
-                log_entry["time"] = datetime.fromisoformat(log_entry["time"])
-                log_entry["state"] = ChunkState.from_str(log_entry["state"])
-                logs.append(log_entry)
-
+            reply_json = json.loads(reply.data.decode("utf-8"))
+            if log_offsets is not None:
+                # gateways from before incremental polling don't return next_seq, so advance by the rows received
+                log_offsets[node.gateway_id] = reply_json.get("next_seq", since + len(reply_json["chunk_status_log"]))
+            logs = pd.DataFrame(reply_json["chunk_status_log"])
+            logs["region_tag"] = node.region_tag
+            logs["instance"] = node.gateway_id
             return logs
 
-        rows = []
-        for result in do_parallel(get_chunk_status, self.dataplane.bound_nodes.items(), n=8, return_args=False):
-            rows.extend(result)
-        return rows
+        results = do_parallel(get_chunk_status, self.dataplane.bound_nodes.items(), n=8, return_args=False, executor=executor)
+        frames = [logs for logs in results if not logs.empty]
+        if not frames:
+            return pd.DataFrame()
+        log_df = pd.concat(frames, ignore_index=True)
+        try:
+            # gateway images from before fixed-precision timestamps omit the fraction on whole seconds, so precision can be mixed
+            log_df["time"] = pd.to_datetime(log_df["time"], format="ISO8601")
+        except ValueError:
+            # pandas < 2 has no ISO8601 format, but infers mixed precision on its own
+            log_df["time"] = pd.to_datetime(log_df["time"])
+        log_df["state"] = log_df["state"].str.lower().map({state.name: state for state in ChunkState})
+        return log_df
 
     @property
     def is_complete(self, region_tag: str):
@@ -374,9 +436,8 @@ class TransferProgressTracker(Thread):
         for job_uuid in self.job_pending_chunk_ids.keys():
             bytes_remaining_per_job[job_uuid] = sum(
                 [
-                    cr.chunk_length_bytes
-                    for cr in self.job_chunk_requests[job_uuid].values()
-                    if cr.chunk_id in self.job_pending_chunk_ids[job_uuid][region_tag]
+                    self.job_chunk_requests[job_uuid][chunk_id].chunk_length_bytes
+                    for chunk_id in self.job_pending_chunk_ids[job_uuid][region_tag]
                 ]
             )
         logger.fs.debug(f"[TransferProgressTracker] Bytes remaining per job: {bytes_remaining_per_job}")
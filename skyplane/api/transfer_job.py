@@ -1,3 +1,4 @@
+import gzip
 import json
 import time
 import time
@@ -31,7 +32,7 @@ from skyplane.utils import logger
 from skyplane.utils.definitions import MB
 from skyplane.utils.fn import do_parallel
 from skyplane.utils.path import parse_path
-from skyplane.utils.retry import retry_backoff
+from skyplane.utils.retry import FullJitterRetry, retry_backoff
 
 if TYPE_CHECKING:
     from skyplane.api.dataplane import Dataplane
@@ -95,7 +96,7 @@ class Chunker:
         """Chunks large files into many small chunks."""
         while not exit_event.is_set():
             try:
-                transfer_pair = in_queue.get(block=False, timeout=0.1)
+                transfer_pair = in_queue.get(timeout=0.1)
             except queue.Empty:
                 continue
 
@@ -517,7 +518,7 @@ class TransferJob(ABC):
     @property
     def dst_ifaces(self) -> List[StorageInterface]:
         """Return the destination object store interface"""
-        if not hasattr(self, "_dst_iface"):
+        if not hasattr(self, "_dst_ifaces"):
             if self.transfer_type == "unicast":
                 provider_dst, bucket_dst, _ = parse_path(self.dst_paths[0])
                 self._dst_ifaces = [StorageInterface.create(f"{provider_dst}:infer", bucket_dst)]
@@ -582,7 +583,7 @@ class CopyJob(TransferJob):
         """http connection pool"""
         if not hasattr(self, "_http_pool"):
             timeout = urllib3.util.Timeout(connect=10.0, read=None)  # no read timeout
-            self._http_pool = urllib3.PoolManager(retries=urllib3.Retry(total=3), timeout=timeout)
+            self._http_pool = urllib3.PoolManager(retries=FullJitterRetry(total=3, backoff_factor=1.0), timeout=timeout)
         return self._http_pool
 
     def gen_transfer_pairs(
@@ -624,57 +625,70 @@ class CopyJob(TransferJob):
 
         # dispatch chunk requests
         src_gateways = dataplane.source_gateways()
+        dst_gateways = [dst_gateway for region_gateways in dataplane.sink_gateways().values() for dst_gateway in region_gateways]
         queue_size = [0] * len(src_gateways)
         n_multiparts = 0
+        # gateway images from before compressed chunk requests reject gzip bodies, so those get plain JSON
+        plain_json_gateways = set()
         time.time()
 
         for batch in batches:
-            # send upload_id mappings to sink gateways
+            # collect upload id mappings
             upload_id_batch = [cr for cr in batch if cr.upload_id_mapping is not None]
-            region_dst_gateways = dataplane.sink_gateways()
-            for region_tag, dst_gateways in region_dst_gateways.items():
-                for dst_gateway in dst_gateways:
-                    # collect upload id mappings
-                    mappings = {}
-                    for message in upload_id_batch:
-                        for region_tag, (key, id) in message.upload_id_mapping.items():
-                            if region_tag not in mappings:
-                                mappings[region_tag] = {}
-                            mappings[region_tag][key] = id
-
-                    # send mapping to gateway
-                    reply = self.http_pool.request(
-                        "POST",
-                        f"{dst_gateway.gateway_api_url}/api/v1/upload_id_maps",
-                        body=json.dumps(mappings).encode("utf-8"),
-                        headers={"Content-Type": "application/json"},
+            mappings = {}
+            for message in upload_id_batch:
+                for region_tag, (key, id) in message.upload_id_mapping.items():
+                    if region_tag not in mappings:
+                        mappings[region_tag] = {}
+                    mappings[region_tag][key] = id
+
+            # send upload_id mappings to sink gateways
+            for dst_gateway in dst_gateways:
+                reply = self.http_pool.request(
+                    "POST",
+                    f"{dst_gateway.gateway_api_url}/api/v1/upload_id_maps",
+                    body=json.dumps(mappings).encode("utf-8"),
+                    headers={"Content-Type": "application/json"},
+                )
+                # TODO: assume that only destination nodes would write to the obj store
+                if reply.status != 200:
+                    raise Exception(
+                        f"Failed to update upload ids to the dst gateway {dst_gateway.instance_name()}: {reply.data.decode('utf-8')}"
                     )
-                    # TODO: assume that only destination nodes would write to the obj store
-                    if reply.status != 200:
-                        raise Exception(
-                            f"Failed to update upload ids to the dst gateway {dst_gateway.instance_name()}: {reply.data.decode('utf-8')}"
-                        )
 
             # send chunk requests to source gateways
             chunk_batch = [cr.chunk for cr in batch if cr.chunk is not None]
             # TODO: allow multiple partition ids per chunk
             for chunk in chunk_batch:  # assign job UUID as partition ID
                 chunk.partition_id = self.uuid
+            chunk_dicts = [chunk.as_dict() for chunk in chunk_batch]
             min_idx = queue_size.index(min(queue_size))
             n_added = 0
             while n_added < len(chunk_batch):
                 # TODO: should update every source instance queue size
                 server = src_gateways[min_idx]
-                assert Chunk.from_dict(chunk_batch[0].as_dict()) == chunk_batch[0], f"Invalid chunk request: {chunk_batch[0].as_dict}"
+                assert Chunk.from_dict(chunk_dicts[0]) == chunk_batch[0], f"Invalid chunk request: {chunk_dicts[0]}"
 
                 # TODO: make async
                 st = time.time()
-                reply = self.http_pool.request(
-                    "POST",
-                    f"{server.gateway_api_url}/api/v1/chunk_requests",
-                    body=json.dumps([chunk.as_dict() for chunk in chunk_batch[n_added:]]).encode("utf-8"),
-                    headers={"Content-Type": "application/json"},
-                )
+                body = json.dumps(chunk_dicts[n_added:], separators=(",", ":")).encode("utf-8")
+                if server not in plain_json_gateways:
+                    reply = self.http_pool.request(
+                        "POST",
+                        f"{server.gateway_api_url}/api/v1/chunk_requests",
+                        body=gzip.compress(body, compresslevel=3),
+                        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+                    )
+                    if 400 <= reply.status < 500:
+                        logger.fs.warning(f"Gateway {server} rejected a compressed chunk request ({reply.status}), falling back to JSON")
+                        plain_json_gateways.add(server)
+                if server in plain_json_gateways:
+                    reply = self.http_pool.request(
+                        "POST",
+                        f"{server.gateway_api_url}/api/v1/chunk_requests",
+                        body=body,
+                        headers={"Content-Type": "application/json"},
+                    )
                 if reply.status != 200:
                     raise Exception(f"Failed to dispatch chunk requests {server.instance_name()}: {reply.data.decode('utf-8')}")
                 et = time.time()
@@ -712,9 +726,10 @@ class CopyJob(TransferJob):
                     retry_backoff(
                         partial(obj_store_interface.complete_multipart_upload, req["key"], req["upload_id"], req["metadata"]),
                         initial_backoff=0.5,
+                        jitter=True,
                     )
 
-            do_parallel(complete_fn, batches, n=8)
+            do_parallel(complete_fn, batches, n=64)
 
         # TODO: Do NOT do this if we are pipelining multiple transfers - remove just what was completed
         self.multipart_transfer_list = []
@@ -1,5 +1,5 @@
 import socket
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from enum import Enum, auto
 from functools import total_ordering
 
@@ -36,7 +36,8 @@ class Chunk:
         )
 
     def as_dict(self):
-        return asdict(self)
+        # fields are all scalars, so a shallow copy is enough (avoids the recursive deepcopy done by dataclasses' asdict)
+        return {field.name: getattr(self, field.name) for field in fields(self)}
 
     @staticmethod
     def from_dict(d: Dict):
@@ -66,7 +67,7 @@ class ChunkRequest:
             assert self.dst_object_store_bucket is not None
 
     def as_dict(self):
-        dict_out = asdict(self)
+        dict_out = {field.name: getattr(self, field.name) for field in fields(self)}
         dict_out["chunk"] = self.chunk.as_dict()
         return dict_out
 
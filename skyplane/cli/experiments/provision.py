@@ -7,16 +7,21 @@ from skyplane.utils import logger
 from skyplane.utils.fn import do_parallel
 from skyplane.utils.timer import Timer
 
+# default cap on concurrent per-region instance listings for each provider, to stay under the cloud API rate limits
+MAX_LIST_INSTANCES_JOBS = {"aws": 20, "azure": 10, "gcp": 4, "ibmcloud": 8}
+
 
 def refresh_instance_list(
-    provider: compute.CloudProvider, region_list: Iterable[str] = (), instance_filter=None, n=-1
+    provider: compute.CloudProvider, region_list: Iterable[str] = (), instance_filter=None, n=-1, spinner=True
 ) -> Dict[str, List[compute.Server]]:
     if instance_filter is None:
         instance_filter = {"tags": {"skyplane": "true"}}
+    if n == -1:
+        n = MAX_LIST_INSTANCES_JOBS.get(provider.name, -1)
     results = do_parallel(
         lambda region: provider.get_matching_instances(region=region, **instance_filter),
         region_list,
-        spinner=True,
+        spinner=spinner,
         n=n,
         desc="Querying clouds for active instances",
     )
@@ -53,7 +58,7 @@ def provision(
     gcp_instances = {}
     ibmcloud_instances = {}
 
-    # TODO: It might be significantly faster to provision AWS, Azure, and GCP concurrently (e.g., using threads)
+    # TODO: setup and instance listing run concurrently across providers, but missing instances are still created one provider at a time
 
     jobs = []
     jobs.append(partial(aws.setup_global, attach_policy_arn="arn:aws:iam::aws:policy/AmazonS3FullAccess"))
@@ -72,15 +77,53 @@ def provision(
     with Timer("Cloud SSH key initialization"):
         do_parallel(lambda fn: fn(), jobs)
 
+    aws_instance_filter = {
+        "tags": {"skyplane": "true"},
+        "instance_type": aws_instance_class,
+        "state": [compute.ServerState.PENDING, compute.ServerState.RUNNING],
+    }
+    azure_instance_filter = {
+        "tags": {"skyplane": "true"},
+        "instance_type": azure_instance_class,
+        "state": [compute.ServerState.PENDING, compute.ServerState.RUNNING],
+    }
+    gcp_instance_filter = {
+        "tags": {"skyplane": "true"},
+        "instance_type": gcp_instance_class,
+        "state": [compute.ServerState.PENDING, compute.ServerState.RUNNING],
+        "network_tier": "PREMIUM" if gcp_use_premium_network else "STANDARD",
+    }
+    ibmcloud_instance_filter = {
+        "tags": {"skyplane": "true"},
+        "instance_type": ibmcloud_instance_class,
+        "state": [compute.ServerState.PENDING, compute.ServerState.RUNNING],
+    }
     if len(aws_regions_to_provision) > 0:
-        logger.info(f"Provisioning AWS instances in {aws_regions_to_provision}")
-        aws_instance_filter = {
-            "tags": {"skyplane": "true"},
-            "instance_type": aws_instance_class,
-            "state": [compute.ServerState.PENDING, compute.ServerState.RUNNING],
-        }
         do_parallel(aws.add_ips_to_security_group, aws_regions_to_provision, spinner=True, desc="Add IP to aws security groups")
-        aws_instances = refresh_instance_list(aws, aws_regions_to_provision, aws_instance_filter)
+    if len(ibmcloud_regions_to_provision) > 0:
+        do_parallel(aws.add_ips_to_security_group, ibmcloud_regions_to_provision, spinner=True, desc="Add IP to IBM Cloud security groups")
+
+    # query every provider for reusable instances concurrently rather than one provider at a time
+    scan_jobs = {}
+    if len(aws_regions_to_provision) > 0:
+        scan_jobs["aws"] = partial(refresh_instance_list, aws, aws_regions_to_provision, aws_instance_filter, spinner=False)
+    if len(azure_regions_to_provision) > 0:
+        scan_jobs["azure"] = partial(refresh_instance_list, azure, azure_regions_to_provision, azure_instance_filter, spinner=False)
+    if len(gcp_regions_to_provision) > 0:
+        scan_jobs["gcp"] = partial(refresh_instance_list, gcp, gcp_regions_to_provision, gcp_instance_filter, spinner=False)
+    if len(ibmcloud_regions_to_provision) > 0:
+        scan_jobs["ibmcloud"] = partial(
+            refresh_instance_list, ibmcloud, ibmcloud_regions_to_provision, ibmcloud_instance_filter, spinner=False
+        )
+    scan_results = dict(
+        do_parallel(
+            lambda provider: scan_jobs[provider](), list(scan_jobs.keys()), spinner=True, desc="Querying clouds for active instances"
+        )
+    )
+
+    if len(aws_regions_to_provision) > 0:
+        logger.info(f"Provisioning AWS instances in {aws_regions_to_provision}")
+        aws_instances = scan_results["aws"]
         missing_aws_regions = set(aws_regions_to_provision) - set(aws_instances.keys())
         if missing_aws_regions:
             logger.info(f"(AWS) provisioning missing regions: {missing_aws_regions}")
@@ -92,12 +135,7 @@ def provision(
 
     if len(azure_regions_to_provision) > 0:
         logger.info(f"Provisioning Azure instances in {azure_regions_to_provision}")
-        azure_instance_filter = {
-            "tags": {"skyplane": "true"},
-            "instance_type": azure_instance_class,
-            "state": [compute.ServerState.PENDING, compute.ServerState.RUNNING],
-        }
-        azure_instances = refresh_instance_list(azure, azure_regions_to_provision, azure_instance_filter)
+        azure_instances = scan_results["azure"]
         missing_azure_regions = set(azure_regions_to_provision) - set(azure_instances.keys())
         if missing_azure_regions:
             logger.info(f"(Azure) provisioning missing regions: {missing_azure_regions}")
@@ -119,13 +157,7 @@ def provision(
 
     if len(gcp_regions_to_provision) > 0:
         logger.info(f"Provisioning GCP instances in {gcp_regions_to_provision}")
-        gcp_instance_filter = {
-            "tags": {"skyplane": "true"},
-            "instance_type": gcp_instance_class,
-            "state": [compute.ServerState.PENDING, compute.ServerState.RUNNING],
-            "network_tier": "PREMIUM" if gcp_use_premium_network else "STANDARD",
-        }
-        gcp_instances = refresh_instance_list(gcp, gcp_regions_to_provision, gcp_instance_filter, n=4)
+        gcp_instances = scan_results["gcp"]
         missing_gcp_regions = set(gcp_regions_to_provision) - set(gcp_instances.keys())
 
         # filter duplicate regions from list and select lexicographically smallest region by zone
@@ -160,13 +192,7 @@ def provision(
 
     if len(ibmcloud_regions_to_provision) > 0:
         logger.info(f"Provisioning IBM Cloud instances in {ibmcloud_regions_to_provision}")
-        ibmcloud_instance_filter = {
-            "tags": {"skyplane": "true"},
-            "instance_type": ibmcloud_instance_class,
-            "state": [compute.ServerState.PENDING, compute.ServerState.RUNNING],
-        }
-        do_parallel(aws.add_ips_to_security_group, ibmcloud_regions_to_provision, spinner=True, desc="Add IP to IBM Cloud security groups")
-        ibmcloud_instances = refresh_instance_list(ibmcloud, ibmcloud_regions_to_provision, ibmcloud_instance_filter)
+        ibmcloud_instances = scan_results["ibmcloud"]
         missing_ibmcloud_regions = set(ibmcloud_regions_to_provision) - set(ibmcloud_instances.keys())
         if missing_ibmcloud_regions:
             logger.info(f"(IBM Cloud) provisioning missing regions: {missing_ibmcloud_regions}")
@@ -187,12 +187,17 @@ class AWSNetwork:
         # Remove instance IP from security group
         sg = self.get_security_group(aws_region)
         try:
-            for rule in sg.ip_permissions:
-                if any([ip_range.get("CidrIp", "").split("/")[0] in ips for ip_range in rule.get("IpRanges", [])]):
-                    response = sg.revoke_ingress(IpPermissions=[rule])
-                    logger.fs.debug(
-                        f"[aws_network]:{aws_region} Removing rule {rule} from security group {sg.group_name}, got response {response}"
-                    )
+            # revoke all matching rules in a single API call
+            rules = [
+                rule
+                for rule in sg.ip_permissions
+                if any([ip_range.get("CidrIp", "").split("/")[0] in ips for ip_range in rule.get("IpRanges", [])])
+            ]
+            if rules:
+                response = sg.revoke_ingress(IpPermissions=rules)
+                logger.fs.debug(
+                    f"[aws_network]:{aws_region} Removing rules {rules} from security group {sg.group_name}, got response {response}"
+                )
         except exceptions.ClientError as e:
             logger.fs.error(f"[aws_network]:{aws_region} Error removing IPs {ips} from security group {sg.group_name}: {e}")
             if "The specified rule does not exist in this security group." not in str(e):
@@ -141,12 +141,6 @@ class AWSServer(Server):
                 f"Failed to connect to AWS server {self.uuid()}. Delete local AWS keys and retry: `rm -rf {key_root / 'aws'}`"
             ) from e
 
-    def get_sftp_client(self):
-        t = paramiko.Transport((self.public_ip(), 22))
-        # t.connect(username="ec2-user", pkey=paramiko.RSAKey.from_private_key_file(str(self.local_keyfile)))
-        t.connect(username=self.login_name, pkey=paramiko.RSAKey.from_private_key_file(str(self.local_keyfile)))
-        return paramiko.SFTPClient.from_transport(t)
-
     def open_ssh_tunnel_impl(self, remote_port):
         import sshtunnel
 
@@ -187,12 +187,6 @@ class AzureServer(Server):
                 f"Failed to connect to Azure server {self.uuid()}. Delete local Azure keys and retry: `rm -rf {key_root / 'azure'}`"
             ) from e
 
-    def get_sftp_client(self, uname="skyplane", ssh_key_password="skyplane"):
-        t = paramiko.Transport((self.public_ip(), 22))
-        pkey = paramiko.RSAKey.from_private_key_file(str(self.ssh_private_key), password=ssh_key_password)
-        t.connect(username=uname, pkey=pkey)
-        return paramiko.SFTPClient.from_transport(t)
-
     def open_ssh_tunnel_impl(self, remote_port, uname="skyplane", ssh_key_password="skyplane"):
         import sshtunnel
 
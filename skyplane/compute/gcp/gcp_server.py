@@ -11,6 +11,7 @@ with warnings.catch_warnings():
 from skyplane import exceptions
 from skyplane.compute.gcp.gcp_auth import GCPAuthentication
 from skyplane.compute.server import Server, ServerState, key_root
+from skyplane.utils.cache import ignore_lru_cache
 from skyplane.utils.fn import PathLike
 
 
@@ -47,10 +48,12 @@ class GCPServer(Server):
         else:
             return None
 
+    @ignore_lru_cache()
     def public_ip(self):
         """Get public IP for instance with GCP client"""
         return self.get_instance_property("networkInterfaces")[0]["accessConfigs"][0].get("natIP")
 
+    @ignore_lru_cache()
     def private_ip(self):
         return self.get_instance_property("networkInterfaces")[0]["networkIP"]
 
@@ -101,12 +104,6 @@ class GCPServer(Server):
                 f"Failed to connect to GCP server {self.uuid()}. Delete local GCP keys and retry: `rm -rf {key_root / 'gcp'}`"
             ) from e
 
-    def get_sftp_client(self, uname="skyplane", ssh_key_password="skyplane"):
-        t = paramiko.Transport((self.public_ip(), 22))
-        pkey = paramiko.RSAKey.from_private_key_file(str(self.ssh_private_key), password=ssh_key_password)
-        t.connect(username=uname, pkey=pkey)
-        return paramiko.SFTPClient.from_transport(t)
-
     def open_ssh_tunnel_impl(self, remote_port, uname="skyplane", ssh_key_password="skyplane"):
         import sshtunnel
 
@@ -78,6 +78,7 @@ class IBMCloudServer(Server):
         return self.vsi.get_ssh_client()
 
     def get_sftp_client(self):
+        # the ibm_gen2 SSHClient wrapper has no open_sftp, so SFTP needs its own transport
         t = paramiko.Transport((self.public_ip(), 22))
         t.connect(
             username=self.vsi.ssh_credentials["username"],
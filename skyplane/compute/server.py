@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+import shutil
 import socket
 from contextlib import closing
 from enum import Enum, auto
@@ -112,7 +113,8 @@ class Server:
             self.command_log_file = None
 
     def get_sftp_client(self):
-        raise NotImplementedError()
+        """Open an SFTP session as a channel on the cached SSH connection (no new handshake). Override if ssh_client is not paramiko."""
+        return self.ssh_client.open_sftp()
 
     def get_ssh_client_impl(self):
         raise NotImplementedError()
@@ -230,16 +232,34 @@ class Server:
         self.command_log.append(dict(command=command, runtime=runtime, **kwargs))
         self.flush_command_log()
 
+    def with_autoshutdown_refresh(self, command):
+        """Prefix a command so running it also resets the server's auto-shutdown timer"""
+        if self.auto_shutdown_timeout_minutes:
+            return f"(nohup /tmp/autoshutdown.sh {self.auto_shutdown_timeout_minutes} &> /dev/null < /dev/null); {command}"
+        return command
+
     def run_command(self, command) -> Tuple[str, str]:
         client = self.ssh_client
         with Timer() as t:
-            if self.auto_shutdown_timeout_minutes:
-                command = f"(nohup /tmp/autoshutdown.sh {self.auto_shutdown_timeout_minutes} &> /dev/null < /dev/null); {command}"
+            command = self.with_autoshutdown_refresh(command)
             _, stdout, stderr = client.exec_command(command)
             stdout, stderr = (stdout.read().decode("utf-8"), stderr.read().decode("utf-8"))
         self.add_command_log(command=command, stdout=stdout, stderr=stderr, runtime=t.elapsed)
         return stdout, stderr
 
+    def run_command_to_file(self, command, local_path):
+        """Run a command and stream its stdout into a local file over the existing SSH connection"""
+        client = self.ssh_client
+        with Timer() as t:
+            command = self.with_autoshutdown_refresh(command)
+            _, stdout, _ = client.exec_command(command)
+            with open(local_path, "wb") as f:
+                shutil.copyfileobj(stdout, f)
+            exit_status = stdout.channel.recv_exit_status()
+        if exit_status != 0:
+            logger.fs.warning(f"[Server.run_command_to_file] {self.uuid()}: `{command}` exited with status {exit_status}")
+        self.add_command_log(command=command, local_path=str(local_path), exit_status=exit_status, runtime=t.elapsed)
+
     def download_file(self, remote_path, local_path):
         """Download a file from the server"""
         sftp_client = self.get_sftp_client()
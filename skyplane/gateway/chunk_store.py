@@ -82,7 +82,7 @@ class ChunkStore:
             "chunk_id": chunk_req.chunk.chunk_id,
             "partition": chunk_req.chunk.partition_id,
             "state": new_status.name,
-            "time": str(datetime.utcnow().isoformat()),
+            "time": str(datetime.utcnow().isoformat(timespec="microseconds")),  # fixed precision so clients can parse the column in bulk
             "handle": operator_handle,
             "worker_id": worker_id,
         }
@@ -1,3 +1,5 @@
+import gzip
+import json
 import logging
 from collections import defaultdict
 import logging.handlers
@@ -26,9 +28,9 @@ class GatewayDaemonAPI(threading.Thread):
     * DELETE /api/v1/servers/<int:port> - stops a server
     * GET /api/v1/chunk_requests - returns list of chunk requests (use {'state': '<state>'} to filter)
     * GET /api/v1/chunk_requests/<chunk_id> - returns chunk request
-    * POST /api/v1/chunk_requests - adds a new chunk request
+    * POST /api/v1/chunk_requests - adds a new chunk request (body may be sent with Content-Encoding: gzip)
     * PUT /api/v1/chunk_requests/<chunk_id> - updates chunk request
-    * GET /api/v1/chunk_status_log - returns list of chunk status log entries
+    * GET /api/v1/chunk_status_log - returns chunk status log (use {'since': <next_seq>} for new entries, {'wait_ms': <ms>} to long-poll)
     * POST /api/v1/upload_id_maps - post a json which contains mapping of region:bucket:key to upload id to each server
     """
 
@@ -74,6 +76,7 @@ class GatewayDaemonAPI(threading.Thread):
         self.chunk_requests: Dict[str, ChunkRequest] = {}
         self.sender_compressed_sizes: Dict[str, Tuple[int, int]] = {}  # TODO: maintain as chunks are completed
         self.chunk_status_log: List[Dict] = []
+        self.chunk_status_log_cond = threading.Condition()  # notified on append, for long-polling clients
         self.chunk_completions = defaultdict(list)
 
         # socket profiles
@@ -148,11 +151,10 @@ class GatewayDaemonAPI(threading.Thread):
                 # otherwise, the client needs to filter chunk updates depending on whether the operator is terminal or not
                 # this would require us to inform the client about the terminal operators, whcih seems annoying (though doable)
                 # we can change this if we need to profile the chunk status progression through the DAG in detail
-                if elem["state"] == ChunkState.complete.name:
-                    if handle in self.terminal_operators[elem["partition"]]:
+                if elem["state"] != ChunkState.complete.name or handle in self.terminal_operators[elem["partition"]]:
+                    with self.chunk_status_log_cond:
                         self.chunk_status_log.append(elem)
-                else:
-                    self.chunk_status_log.append(elem)
+                        self.chunk_status_log_cond.notify_all()
 
     def run(self):
         self.server.serve_forever()
@@ -265,9 +267,13 @@ class GatewayDaemonAPI(threading.Thread):
         # add a new chunk request with default state registered
         @app.route("/api/v1/chunk_requests", methods=["POST"])
         def add_chunk_request():
-            print(f"[gateway_api] Recieved chunk request {request.json}")
+            if request.headers.get("Content-Encoding") == "gzip":
+                body = json.loads(gzip.decompress(request.get_data()))
+            else:
+                body = request.get_json()
+            print(f"[gateway_api] Recieved {len(body) if isinstance(body, list) else 1} chunk requests")
             state_param = request.args.get("state", "registered")
-            n_added, qsize, succ = add_chunk_req(request.json, ChunkState.from_str(state_param))
+            n_added, qsize, succ = add_chunk_req(body, ChunkState.from_str(state_param))
             # TODO: Add to chunk manager queue
             print(f"[gateway_api] Added {n_added} chunk requests to queue, size {qsize} success {succ}")
             return jsonify({"status": succ, "n_added": n_added, "qsize": qsize})
@@ -292,11 +298,16 @@ class GatewayDaemonAPI(threading.Thread):
         # list chunk status log
         @app.route("/api/v1/chunk_status_log", methods=["GET"])
         def get_chunk_status_log():
+            # the log is append-only, so clients can poll incrementally by passing back next_seq as since
+            # with wait_ms, block until there are entries past since (or the timeout expires) instead of returning empty
+            since = request.args.get("since", 0, type=int)
+            wait_ms = request.args.get("wait_ms", 0, type=int)
+            if wait_ms > 0:
+                with self.chunk_status_log_cond:
+                    self.chunk_status_log_cond.wait_for(lambda: len(self.chunk_status_log) > since, timeout=wait_ms / 1000)
             n_entries = len(self.chunk_status_log)
-            status_log_copy = []  # copy to support concurrent access
-            for i in range(n_entries):
-                status_log_copy.append(self.chunk_status_log[i])
-            return jsonify({"chunk_status_log": status_log_copy})
+            status_log_copy = self.chunk_status_log[since:n_entries]  # copy to support concurrent access
+            return jsonify({"chunk_status_log": status_log_copy, "next_seq": n_entries})
 
         # post the upload ids mapping
         @app.route("/api/v1/upload_id_maps", methods=["POST"])
@@ -1,3 +1,5 @@
+import threading
+
 import cachetools
 
 
@@ -20,9 +22,10 @@ class IngoreLRUCache(cachetools.LRUCache):
 
 
 def ignore_lru_cache(ignored_value=None, maxsize=128, *args, **kwargs):
-    """Decorator to ignore LRU cache when value is ignored_value"""
+    """Decorator to ignore LRU cache when value is ignored_value (the cache is locked, so it is safe to call from many threads)"""
 
     def decorator(func):
-        return cachetools.cached(IngoreLRUCache(ignored_value, maxsize=maxsize, *args, **kwargs))(func)
+        cache = IngoreLRUCache(ignored_value, maxsize=maxsize, *args, **kwargs)
+        return cachetools.cached(cache, lock=threading.RLock())(func)
 
     return decorator
@@ -1,4 +1,5 @@
 import time
+from contextlib import nullcontext
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
@@ -26,8 +27,17 @@ def wait_for(fn: Callable[[], bool], timeout=60, interval=0.25, desc="Waiting",
 
 
 def do_parallel(
-    func: Callable[[T], R], args_list: Iterable[T], n=-1, desc=None, arg_fmt=None, return_args=True, spinner=False, spinner_persist=False
+    func: Callable[[T], R],
+    args_list: Iterable[T],
+    n=-1,
+    desc=None,
+    arg_fmt=None,
+    return_args=True,
+    spinner=False,
+    spinner_persist=False,
+    executor: Optional[ThreadPoolExecutor] = None,
 ) -> List[Union[Tuple[T, R], R]]:
+    """Run func over args_list in a thread pool. Pass a long-lived executor to reuse its threads across calls (n is then ignored)."""
     args_list = list(args_list)
     if len(args_list) == 0:
         return []
@@ -51,8 +61,8 @@ def do_parallel(
     ) as progress:
         progress_task = progress.add_task("", total=len(args_list))
         with Timer() as t:
-            with ThreadPoolExecutor(max_workers=n) as executor:
-                future_list = [executor.submit(wrapped_fn, args) for args in args_list]
+            with ThreadPoolExecutor(max_workers=n) if executor is None else nullcontext(executor) as pool:
+                future_list = [pool.submit(wrapped_fn, args) for args in args_list]
                 for future in as_completed(future_list):
                     args, result = future.result()
                     results.append((args, result))
@@ -1,5 +1,7 @@
+import random
 import time
 
+import urllib3
 from typing import Callable, TypeVar
 
 from skyplane.utils import logger
@@ -15,10 +17,12 @@ def retry_backoff(
     exception_class=Exception,
     log_errors=True,
     always_raise_exceptions=(),
+    jitter=False,
 ) -> R:
     """Retry fn until it does not raise an exception.
     If it fails, sleep for a bit and try again.
     Double the backoff time each time.
+    If jitter is set, sleep a random time in [0, backoff] instead (full jitter) so concurrent callers spread out their retries.
     If it fails max_retries times, raise the last exception.
     """
     backoff = initial_backoff
@@ -33,5 +37,17 @@ def retry_backoff(
                 if log_errors:
                     fn_name = fn.__name__ if hasattr(fn, "__name__") else "unknown function"
                     logger.fs.warning(f"Retrying {fn_name} due to: {e} (attempt {i + 1}/{max_retries})")
-                time.sleep(backoff)
+                time.sleep(random.uniform(0, backoff) if jitter else backoff)
                 backoff = min(backoff * 2, max_backoff)
+
+
+class FullJitterRetry(urllib3.Retry):
+    """urllib3 retry policy using exponential backoff with full jitter.
+    Each backoff is drawn uniformly from [0, min(max_backoff, backoff_factor * 2 ** attempt)] so that many clients
+    polling the same gateways do not retry in lockstep.
+    """
+
+    max_backoff = 30.0
+
+    def get_backoff_time(self) -> float:
+        return random.uniform(0, min(self.max_backoff, super().get_backoff_time()))
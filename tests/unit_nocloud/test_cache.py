@@ -0,0 +1,27 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from skyplane.utils.cache import ignore_lru_cache
+
+
+def test_ignore_lru_cache_skips_ignored_value():
+    calls = []
+
+    @ignore_lru_cache()
+    def lookup(key):
+        calls.append(key)
+        return None if key == "missing" else key
+
+    assert lookup("a") == "a" and lookup("a") == "a"
+    assert lookup("missing") is None and lookup("missing") is None
+    assert calls == ["a", "missing", "missing"]
+
+
+def test_ignore_lru_cache_concurrent_evictions():
+    @ignore_lru_cache(maxsize=16)
+    def lookup(key):
+        return key
+
+    # many more keys than the cache holds, so threads evict entries from under each other
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        results = list(executor.map(lookup, [i % 500 for i in range(20000)]))
+    assert results == [i % 500 for i in range(20000)]
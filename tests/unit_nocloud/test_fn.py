@@ -0,0 +1,26 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from skyplane.utils.fn import do_parallel
+
+
+def test_do_parallel_results():
+    assert sorted(do_parallel(lambda x: x * 2, range(5), return_args=False)) == [0, 2, 4, 6, 8]
+    assert sorted(do_parallel(lambda x: x * 2, range(3))) == [(0, 0), (1, 2), (2, 4)]
+    assert do_parallel(lambda x: x, []) == []
+
+
+def test_do_parallel_reuses_executor():
+    thread_names = set()
+
+    def record(x):
+        thread_names.add(threading.current_thread().name)
+        return x
+
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="shared_pool") as executor:
+        for _ in range(3):
+            assert sorted(do_parallel(record, range(8), return_args=False, executor=executor)) == list(range(8))
+        # the executor must still be usable after do_parallel returns
+        assert executor.submit(lambda: 1).result() == 1
+
+    assert thread_names and all(name.startswith("shared_pool") for name in thread_names)
@@ -0,0 +1,95 @@
+import gzip
+import json
+import threading
+import time
+
+import pytest
+
+from skyplane.chunk import Chunk, ChunkState
+from skyplane.gateway.chunk_store import ChunkStore
+from skyplane.gateway.gateway_daemon_api import GatewayDaemonAPI
+from skyplane.gateway.gateway_queue import GatewayQueue
+
+
+@pytest.fixture
+def api(tmp_path):
+    chunk_store = ChunkStore(tmp_path)
+    chunk_store.add_partition("0", GatewayQueue())
+    api = GatewayDaemonAPI(
+        chunk_store,
+        gateway_receiver=None,
+        error_event=threading.Event(),
+        error_queue=None,
+        terminal_operators={"0": []},
+        num_required_terminal={"0": 1},
+        upload_id_map={},
+        host="127.0.0.1",
+        port=0,
+    )
+    yield api
+    api.server.server_close()
+
+
+def append_status(api, chunk_id, state=ChunkState.registered):
+    with api.chunk_status_log_cond:
+        api.chunk_status_log.append({"chunk_id": chunk_id, "partition": "0", "state": state.name})
+        api.chunk_status_log_cond.notify_all()
+
+
+def make_chunk_payload(chunk_id):
+    return Chunk(src_key="a", dest_key="b", chunk_id=chunk_id, chunk_length_bytes=1, partition_id="0").as_dict()
+
+
+def test_chunk_status_log_since(api):
+    client = api.app.test_client()
+    for i in range(3):
+        append_status(api, str(i))
+
+    reply = client.get("/api/v1/chunk_status_log").get_json()
+    assert [r["chunk_id"] for r in reply["chunk_status_log"]] == ["0", "1", "2"]
+    assert reply["next_seq"] == 3
+
+    append_status(api, "3")
+    reply = client.get("/api/v1/chunk_status_log", query_string={"since": reply["next_seq"]}).get_json()
+    assert [r["chunk_id"] for r in reply["chunk_status_log"]] == ["3"]
+    assert reply["next_seq"] == 4
+
+    reply = client.get("/api/v1/chunk_status_log", query_string={"since": 4}).get_json()
+    assert reply["chunk_status_log"] == []
+    assert reply["next_seq"] == 4
+
+
+def test_chunk_status_log_wait_ms_timeout(api):
+    client = api.app.test_client()
+    start = time.time()
+    reply = client.get("/api/v1/chunk_status_log", query_string={"since": 0, "wait_ms": 200}).get_json()
+    assert time.time() - start >= 0.2
+    assert reply["chunk_status_log"] == []
+    assert reply["next_seq"] == 0
+
+
+def test_chunk_status_log_wait_ms_wakeup(api):
+    client = api.app.test_client()
+    timer = threading.Timer(0.1, append_status, args=(api, "0"))
+    timer.start()
+    start = time.time()
+    reply = client.get("/api/v1/chunk_status_log", query_string={"since": 0, "wait_ms": 10000}).get_json()
+    timer.join()
+    assert time.time() - start < 5
+    assert [r["chunk_id"] for r in reply["chunk_status_log"]] == ["0"]
+    assert reply["next_seq"] == 1
+
+
+def test_add_chunk_requests_plain_and_gzip(api):
+    client = api.app.test_client()
+
+    reply = client.post("/api/v1/chunk_requests", json=[make_chunk_payload("plain")]).get_json()
+    assert reply["status"] and reply["n_added"] == 1
+
+    body = gzip.compress(json.dumps([make_chunk_payload("gz0"), make_chunk_payload("gz1")]).encode("utf-8"))
+    reply = client.post(
+        "/api/v1/chunk_requests", data=body, headers={"Content-Type": "application/json", "Content-Encoding": "gzip"}
+    ).get_json()
+    assert reply["status"] and reply["n_added"] == 2
+
+    assert set(api.chunk_requests.keys()) == {"plain", "gz0", "gz1"}
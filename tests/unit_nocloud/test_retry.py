@@ -0,0 +1,53 @@
+import urllib3
+
+from skyplane.utils import retry
+from skyplane.utils.retry import FullJitterRetry, retry_backoff
+
+
+def increment(policy, n):
+    for _ in range(n):
+        policy = policy.increment(method="GET", url="/api/v1/status", error=urllib3.exceptions.ConnectTimeoutError())
+    return policy
+
+
+def test_full_jitter_retry_survives_increment():
+    policy = increment(FullJitterRetry(total=9, backoff_factor=1.0), 3)
+    assert isinstance(policy, FullJitterRetry)
+    assert len(policy.history) == 3
+
+
+def test_full_jitter_retry_backoff_bounded():
+    # after 3 errors the uncapped backoff is 4s, and after 8 it is far past the cap
+    policy = increment(FullJitterRetry(total=9, backoff_factor=1.0), 3)
+    assert all(0 <= policy.get_backoff_time() <= 4 for _ in range(100))
+    policy = increment(FullJitterRetry(total=9, backoff_factor=1.0), 8)
+    assert all(0 <= policy.get_backoff_time() <= FullJitterRetry.max_backoff for _ in range(100))
+
+
+def make_flaky(n_failures):
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) <= n_failures:
+            raise ValueError("flaky")
+        return len(calls)
+
+    return flaky
+
+
+def test_retry_backoff_jitter_within_backoff(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(retry.time, "sleep", sleeps.append)
+    for _ in range(20):
+        sleeps.clear()
+        assert retry_backoff(make_flaky(4), initial_backoff=0.1, max_backoff=0.4, log_errors=False, jitter=True) == 5
+        assert len(sleeps) == 4
+        assert all(0 <= slept <= backoff for slept, backoff in zip(sleeps, [0.1, 0.2, 0.4, 0.4]))
+
+
+def test_retry_backoff_no_jitter(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(retry.time, "sleep", sleeps.append)
+    assert retry_backoff(make_flaky(4), initial_backoff=0.1, max_backoff=0.4, log_errors=False) == 5
+    assert sleeps == [0.1, 0.2, 0.4, 0.4]
@@ -0,0 +1,67 @@
+import json
+from types import SimpleNamespace
+
+from skyplane.api.tracker import TransferProgressTracker
+from skyplane.chunk import ChunkState
+from skyplane.planner.topology import TopologyPlanGateway
+
+
+class FakePool:
+    """Stands in for the tracker's urllib3 pool, serving canned chunk status log replies per gateway URL."""
+
+    def __init__(self, replies):
+        self.replies = replies
+        self.requests = []
+
+    def request(self, method, url, fields=None):
+        self.requests.append((url, fields))
+        gateway_id = url.split("/api/v1/")[0]
+        return SimpleNamespace(status=200, data=json.dumps(self.replies[gateway_id]).encode("utf-8"))
+
+
+def make_tracker(replies):
+    tracker = TransferProgressTracker.__new__(TransferProgressTracker)
+    bound_nodes = {}
+    for gateway_id in replies:
+        node = TopologyPlanGateway("aws:us-east-1", gateway_id, None)
+        bound_nodes[node] = SimpleNamespace(gateway_api_url=gateway_id, instance_name=lambda gateway_id=gateway_id: gateway_id)
+    tracker.dataplane = SimpleNamespace(bound_nodes=bound_nodes)
+    tracker.http_pool = FakePool(replies)
+    return tracker
+
+
+def make_row(chunk_id, state, time):
+    return {"chunk_id": chunk_id, "partition": "0", "state": state, "time": time, "handle": None, "worker_id": None}
+
+
+def test_query_chunk_status_decodes_mixed_precision_and_state():
+    replies = {
+        "new": {
+            "chunk_status_log": [make_row("0", "complete", "2024-01-01T00:00:00.000001")],
+            "next_seq": 1,
+        },
+        # gateway image from before next_seq and fixed-precision timestamps
+        "old": {
+            "chunk_status_log": [make_row("1", "registered", "2024-01-01T00:00:00"), make_row("1", "in_progress", "2024-01-01T00:00:01")]
+        },
+    }
+    tracker = make_tracker(replies)
+    log_offsets = {"old": 3}
+    log_df = tracker._query_chunk_status(log_offsets)
+
+    assert len(log_df) == 3
+    assert str(log_df["time"].dtype).startswith("datetime64")
+    assert set(log_df["state"]) == {ChunkState.complete, ChunkState.registered, ChunkState.in_progress}
+    assert list(log_df[log_df["state"] == ChunkState.complete]["instance"]) == ["new"]
+    assert log_offsets == {"new": 1, "old": 5}
+
+
+def test_query_chunk_status_empty():
+    tracker = make_tracker({"new": {"chunk_status_log": [], "next_seq": 0}})
+    assert tracker._query_chunk_status().empty
+
+
+def test_query_chunk_status_waits_only_on_listed_gateways():
+    tracker = make_tracker({"sink": {"chunk_status_log": [], "next_seq": 0}, "source": {"chunk_status_log": [], "next_seq": 0}})
+    tracker._query_chunk_status({}, wait_ms=500, wait_gateway_ids={"sink"})
+    assert {url.split("/api/v1/")[0]: fields["wait_ms"] for url, fields in tracker.http_pool.requests} == {"sink": 500, "source": 0}